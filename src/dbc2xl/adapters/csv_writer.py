@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import csv
+import logging
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from ..domain.models import DbcExport
+from ..use_cases.convert import SHEET_NAMES
+from ..utils.formatting import safe_str
+from .sheets import (
+    ATTRIBUTES_HEADERS,
+    MESSAGES_HEADERS,
+    NODES_HEADERS,
+    SIGNALS_HEADERS,
+    VALUE_TABLES_HEADERS,
+)
+
+logger = logging.getLogger(__name__)
+
+_BUFFER_SIZE = 1 << 20
+
+
+class CsvWriter:
+    # One CSV per sheet, derived from the requested output path:
+    # "export.csv" becomes export.messages.csv, export.signals.csv, ...
+    # Skips openpyxl's XML and zip layers entirely, which is the faster
+    # choice for very large exports.
+
+    def write(
+        self, export: DbcExport, xlsx_path: str, sheets: set[str] | None = None
+    ) -> None:
+        if sheets is None:
+            sheets = set(SHEET_NAMES)
+
+        base = Path(xlsx_path)
+
+        if "Messages" in sheets:
+            self._write_csv(base, "messages", MESSAGES_HEADERS, (m.row for m in export.messages))
+        if "Signals" in sheets:
+            self._write_csv(base, "signals", SIGNALS_HEADERS, (s.row for s in export.signals))
+        if "Nodes" in sheets:
+            self._write_csv(base, "nodes", NODES_HEADERS, (n.row for n in export.nodes))
+        if "Attributes" in sheets:
+            rows = ((a.scope, a.owner, a.key, safe_str(a.value)) for a in export.attributes)
+            self._write_csv(base, "attributes", ATTRIBUTES_HEADERS, rows)
+        if "ValueTables" in sheets:
+            rows = (
+                (s.message_name, s.name, s.message_frame_id_hex, k, v)
+                for s in export.signals
+                for k, v in s.choices_items
+            )
+            self._write_csv(base, "value_tables", VALUE_TABLES_HEADERS, rows)
+
+    def _write_csv(
+        self,
+        base: Path,
+        suffix: str,
+        headers: Sequence[str],
+        rows: Iterable[tuple[object, ...]],
+    ) -> None:
+        path = base.with_suffix(f".{suffix}.csv")
+        logger.info("Writing CSV: %s", path)
+        with open(path, "w", newline="", buffering=_BUFFER_SIZE, encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(headers)
+            w.writerows(rows)
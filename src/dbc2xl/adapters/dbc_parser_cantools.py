@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import dataclass
+import operator
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
 from ..domain.models import (
@@ -11,34 +15,94 @@ from ..domain.models import (
     NodeExport,
     SignalExport,
 )
-from ..utils.formatting import frame_id_hex
+from ..utils.formatting import frame_id_hex, safe_str, stringify_choices
 
 logger = logging.getLogger(__name__)
 
+# below this, thread-pool startup outweighs the per-message work
+_PARALLEL_MIN_MESSAGES = 64
+
+# bound once: one attrgetter call fetches all plain fields per object
+# instead of a getattr per field
+_MSG_FIELDS = ("name", "frame_id", "is_extended_frame", "length", "cycle_time", "senders")
+_MSG_GET = operator.attrgetter(*_MSG_FIELDS)
+
+_SIG_FIELDS = (
+    "name",
+    "start",
+    "length",
+    "byte_order",
+    "unit",
+    "is_signed",
+    "is_float",
+    "scale",
+    "offset",
+    "minimum",
+    "maximum",
+    "receivers",
+    "multiplexer_signal",
+    "is_multiplexer",
+)
+_SIG_GET = operator.attrgetter(*_SIG_FIELDS)
+
+
+def _get_many(obj: Any, getter: Any, fields: tuple[str, ...]) -> tuple:
+    try:
+        return getter(obj)
+    except AttributeError:
+        # older cantools objects may lack some of the attributes
+        return tuple(getattr(obj, f, None) for f in fields)
+
 
-def _get_comment(obj: Any) -> str | None:
-    # cantools uses .comment on many objects; sometimes missing
+def _get_comment(obj: Any) -> str:
+    # cantools uses .comment on many objects; sometimes missing.
+    # normalized to "" so downstream rows never need a None check
     c = getattr(obj, "comment", None)
     if c is None:
-        return None
-    c = str(c).strip()
-    return c if c else None
+        return ""
+    return str(c).strip()
+
+
+# shared for the many DBC entities without attributes, so each one skips
+# the dict allocation and downstream sort/join work
+_EMPTY_ATTRS: Mapping[str, object] = {}
 
 
 def _get_attributes(obj: Any) -> Mapping[str, object]:
     # cantools typically exposes .attributes dict for DBC entities
     attrs = getattr(obj, "attributes", None)
-    if isinstance(attrs, dict):
+    if isinstance(attrs, dict) and attrs:
         return attrs
-    return {}
+    return _EMPTY_ATTRS
 
 
-def _as_list(v: Any) -> List[str]:
+def _as_list(v: Any, intern: bool = False) -> List[str]:
+    # intern=True for low-cardinality values (node names) that repeat
+    # across thousands of signals; dedup keeps the export memory-compact
     if v is None:
         return []
     if isinstance(v, (list, tuple)):
-        return [str(x) for x in v]
-    return [str(v)]
+        return [sys.intern(str(x)) for x in v] if intern else [str(x) for x in v]
+    return [sys.intern(str(v))] if intern else [str(v)]
+
+
+_BOOL_STR = {None: "", True: "Yes", False: "No"}
+
+
+def _bool_str(v: object) -> str:
+    # .get covers the common None/True/False cases in one dict lookup;
+    # the fallback keeps truthy non-bool values behaving as before
+    s = _BOOL_STR.get(v)
+    if s is None:
+        return "Yes" if v else "No"
+    return s
+
+
+def _attributes_str(attrs: Mapping[str, object]) -> str:
+    # "Key=Value; ..." rendering shared by the Messages/Signals/Nodes sheets
+    if not attrs:
+        return ""
+    return "; ".join([f"{k}={safe_str(v)}" for k, v in sorted(attrs.items())])
 
 
 def _signal_choices(sig: Any) -> Dict[int, str]:
@@ -55,7 +119,7 @@ def _signal_choices(sig: Any) -> Dict[int, str]:
     return {}
 
 
-def _multiplexer_ids(sig: Any) -> List[int] | None:
+def _multiplexer_ids(sig: Any) -> tuple[int, ...] | None:
     mids = getattr(sig, "multiplexer_ids", None)
     if mids is None:
         return None
@@ -66,143 +130,272 @@ def _multiplexer_ids(sig: Any) -> List[int] | None:
                 out.append(int(x))
             except Exception:
                 pass
-        return out
+        return tuple(out)
     try:
-        return [int(mids)]
+        return (int(mids),)
     except Exception:
         return None
 
 
-@dataclass(frozen=True)
-class CantoolsDbcParser:
-    def parse(self, dbc_path: str, encoding: str | None) -> DbcExport:
-        try:
-            import cantools  # type: ignore
-        except ImportError as e:
-            raise RuntimeError(
-                "cantools is required. Install with: pip install cantools"
-            ) from e
+@functools.lru_cache(maxsize=32)
+def _load_db(dbc_path: str, mtime_ns: int, size: int, encoding: str | None):
+    # keyed on (path, mtime, size) so edits to the file miss the cache
+    import cantools  # type: ignore
 
-        db = cantools.database.load_file(dbc_path, encoding=encoding)
+    return cantools.database.load_file(dbc_path, encoding=encoding)
 
-        nodes: List[NodeExport] = []
-        for n in getattr(db, "nodes", []) or []:
-            nodes.append(
-                NodeExport(
-                    name=str(getattr(n, "name", "")),
-                    comment=_get_comment(n),
-                    attributes=_get_attributes(n),
-                )
-            )
 
-        messages: List[MessageExport] = []
-        signals: List[SignalExport] = []
-        attributes: List[AttributeExport] = []
+@functools.lru_cache(maxsize=32)
+def _parse_file(
+    dbc_path: str, mtime_ns: int, size: int, encoding: str | None, with_signals: bool
+) -> DbcExport:
+    # DbcExport is frozen, so sharing one instance across callers is safe
+    return _build_export(_load_db(dbc_path, mtime_ns, size, encoding), with_signals)
 
-        for m in getattr(db, "messages", []) or []:
-            fid = int(getattr(m, "frame_id", 0))
-            msg_name = str(getattr(m, "name", ""))
 
-            is_ext = getattr(m, "is_extended_frame", None)
-            if isinstance(is_ext, bool) is False:
-                # some versions may not expose it cleanly
-                is_ext = None
+def _process_message(
+    m: Any, with_signals: bool = True
+) -> tuple[MessageExport, List[SignalExport], List[AttributeExport]]:
+    # flattens one message and its signals; touches no shared state, so it
+    # is safe to run from worker threads
+    signals: List[SignalExport] = []
+    attributes: List[AttributeExport] = []
 
-            cycle_time = getattr(m, "cycle_time", None)
-            cycle_time_ms: int | None
-            try:
-                cycle_time_ms = int(cycle_time) if cycle_time is not None else None
-            except Exception:
-                cycle_time_ms = None
-
-            senders = _as_list(getattr(m, "senders", None))
-            msg_attrs = _get_attributes(m)
-
-            messages.append(
-                MessageExport(
-                    name=msg_name,
-                    frame_id=fid,
-                    frame_id_hex=frame_id_hex(fid),
-                    is_extended_frame=is_ext,
-                    length=int(getattr(m, "length", 0)),
-                    cycle_time_ms=cycle_time_ms,
-                    senders=senders,
-                    comment=_get_comment(m),
-                    attributes=msg_attrs,
-                )
+    raw_name, raw_fid, is_ext, raw_length, cycle_time, raw_senders = _get_many(
+        m, _MSG_GET, _MSG_FIELDS
+    )
+
+    fid = int(raw_fid or 0)
+    fid_hex = sys.intern(frame_id_hex(fid))
+    msg_name = sys.intern(str(raw_name) if raw_name is not None else "")
+
+    if isinstance(is_ext, bool) is False:
+        # some versions may not expose it cleanly
+        is_ext = None
+
+    cycle_time_ms: int | None
+    try:
+        cycle_time_ms = int(cycle_time) if cycle_time is not None else None
+    except Exception:
+        cycle_time_ms = None
+
+    senders = tuple(_as_list(raw_senders, intern=True))
+    msg_length = int(raw_length or 0)
+    msg_comment = _get_comment(m)
+    msg_attrs = _get_attributes(m)
+    msg_attrs_str = _attributes_str(msg_attrs)
+
+    message = MessageExport(
+        name=msg_name,
+        frame_id=fid,
+        frame_id_hex=fid_hex,
+        is_extended_frame=is_ext,
+        length=msg_length,
+        cycle_time_ms=cycle_time_ms,
+        senders=senders,
+        comment=msg_comment,
+        attributes=msg_attrs,
+        attributes_str=msg_attrs_str,
+        row=(
+            msg_name,
+            fid_hex,
+            fid,
+            _bool_str(is_ext),
+            msg_length,
+            "" if cycle_time_ms is None else cycle_time_ms,
+            ", ".join(senders),
+            msg_comment,
+            msg_attrs_str,
+        ),
+    )
+
+    # message attributes flattened
+    for k, v in msg_attrs.items():
+        attributes.append(
+            AttributeExport(scope="message", owner=msg_name, key=str(k), value=v)
+        )
+
+    if not with_signals:
+        return message, signals, attributes
+
+    # the signal loop is the hottest Python-level code in the parser;
+    # bind the per-iteration names locally so each pass skips the
+    # global/method lookups
+    append_signal = signals.append
+    append_attribute = attributes.append
+    intern = sys.intern
+
+    for s in getattr(m, "signals", []) or []:
+        (
+            raw_sig_name,
+            raw_start,
+            raw_sig_length,
+            byte_order,
+            unit,
+            is_signed,
+            is_float,
+            factor,
+            offset,
+            minimum,
+            maximum,
+            raw_receivers,
+            mux_sig,
+            is_mux,
+        ) = _get_many(s, _SIG_GET, _SIG_FIELDS)
+
+        sig_name = str(raw_sig_name) if raw_sig_name is not None else ""
+
+        byte_order = intern(str(byte_order)) if byte_order is not None else ""
+
+        if isinstance(unit, str):
+            unit = intern(unit)
+        else:
+            unit = str(unit) if unit is not None else ""
+
+        if not isinstance(is_signed, bool):
+            is_signed = None
+
+        if not isinstance(is_float, bool):
+            is_float = None
+
+        receivers = tuple(_as_list(raw_receivers, intern=True))
+        sig_attrs = _get_attributes(s)
+
+        mux_sig_name = str(getattr(mux_sig, "name", "")) if mux_sig else ""
+
+        if not isinstance(is_mux, bool):
+            is_mux = None
+
+        choices = _signal_choices(s)
+        choices_items = tuple(sorted(choices.items()))
+
+        start = int(raw_start or 0)
+        length = int(raw_sig_length or 0)
+        sig_comment = _get_comment(s)
+        mux_ids = _multiplexer_ids(s)
+        sig_attrs_str = _attributes_str(sig_attrs)
+
+        append_signal(
+            SignalExport(
+                message_name=msg_name,
+                message_frame_id=fid,
+                message_frame_id_hex=fid_hex,
+                name=sig_name,
+                start=start,
+                length=length,
+                byte_order=byte_order,
+                is_signed=is_signed,
+                is_float=is_float,
+                factor=factor,
+                offset=offset,
+                minimum=minimum,
+                maximum=maximum,
+                unit=unit,
+                receivers=receivers,
+                comment=sig_comment,
+                is_multiplexer=is_mux,
+                multiplexer_ids=mux_ids,
+                multiplexer_signal=mux_sig_name,
+                choices=choices,
+                choices_items=choices_items,
+                attributes=sig_attrs,
+                attributes_str=sig_attrs_str,
+                row=(
+                    msg_name,
+                    fid_hex,
+                    fid,
+                    sig_name,
+                    start,
+                    length,
+                    byte_order,
+                    _bool_str(is_signed),
+                    _bool_str(is_float),
+                    "" if factor is None else factor,
+                    "" if offset is None else offset,
+                    "" if minimum is None else minimum,
+                    "" if maximum is None else maximum,
+                    unit,
+                    ", ".join(receivers),
+                    _bool_str(is_mux),
+                    ", ".join(map(str, mux_ids)) if mux_ids else "",
+                    mux_sig_name,
+                    stringify_choices(choices_items) if choices_items else "",
+                    sig_comment,
+                    sig_attrs_str,
+                ),
+            )
+        )
+
+        # signal attributes flattened
+        owner = f"{msg_name}.{sig_name}"
+        for k, v in sig_attrs.items():
+            append_attribute(
+                AttributeExport(scope="signal", owner=owner, key=str(k), value=v)
+            )
+
+    return message, signals, attributes
+
+
+def _build_export(db: Any, with_signals: bool = True) -> DbcExport:
+    nodes: List[NodeExport] = []
+    for n in getattr(db, "nodes", []) or []:
+        node_name = sys.intern(str(getattr(n, "name", "")))
+        node_comment = _get_comment(n)
+        node_attrs = _get_attributes(n)
+        node_attrs_str = _attributes_str(node_attrs)
+        nodes.append(
+            NodeExport(
+                name=node_name,
+                comment=node_comment,
+                attributes=node_attrs,
+                attributes_str=node_attrs_str,
+                row=(node_name, node_comment, node_attrs_str),
             )
+        )
+
+    db_messages = list(getattr(db, "messages", []) or [])
+
+    # messages are independent, so flatten them across a thread pool;
+    # executor.map keeps DBC order
+    if len(db_messages) >= _PARALLEL_MIN_MESSAGES:
+        process = functools.partial(_process_message, with_signals=with_signals)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(process, db_messages))
+    else:
+        results = [_process_message(m, with_signals) for m in db_messages]
+
+    messages: List[MessageExport] = []
+    signals: List[SignalExport] = []
+    attributes: List[AttributeExport] = []
+    for message, msg_signals, msg_attributes in results:
+        messages.append(message)
+        signals.extend(msg_signals)
+        attributes.extend(msg_attributes)
+
+    # node attributes flattened
+    for n in nodes:
+        for k, v in n.attributes.items():
+            attributes.append(
+                AttributeExport(scope="node", owner=n.name, key=str(k), value=v)
+            )
+
+    return DbcExport(nodes=nodes, messages=messages, signals=signals, attributes=attributes)
+
+
+class CantoolsDbcParser:
+    def parse(
+        self, dbc_path: str, encoding: str | None, sheets: set[str] | None = None
+    ) -> DbcExport:
+        try:
+            import cantools  # type: ignore  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError(
+                "cantools is required. Install with: pip install cantools"
+            ) from e
+
+        # the signal loop also collects signal-scoped attribute rows, so the
+        # Attributes sheet needs it too; only pure message/node exports skip it
+        with_signals = sheets is None or bool({"Signals", "ValueTables", "Attributes"} & sheets)
 
-            # message attributes flattened
-            for k, v in msg_attrs.items():
-                attributes.append(
-                    AttributeExport(scope="message", owner=msg_name, key=str(k), value=v)
-                )
-
-            for s in getattr(m, "signals", []) or []:
-                sig_name = str(getattr(s, "name", ""))
-
-                byte_order = getattr(s, "byte_order", None)
-                if byte_order is not None:
-                    byte_order = str(byte_order)
-
-                is_signed = getattr(s, "is_signed", None)
-                if not isinstance(is_signed, bool):
-                    is_signed = None
-
-                is_float = getattr(s, "is_float", None)
-                if not isinstance(is_float, bool):
-                    is_float = None
-
-                receivers = _as_list(getattr(s, "receivers", None))
-                sig_attrs = _get_attributes(s)
-
-                mux_sig = getattr(s, "multiplexer_signal", None)
-                mux_sig_name = str(getattr(mux_sig, "name", "")) if mux_sig else None
-
-                is_mux = getattr(s, "is_multiplexer", None)
-                if not isinstance(is_mux, bool):
-                    is_mux = None
-
-                choices = _signal_choices(s)
-
-                signals.append(
-                    SignalExport(
-                        message_name=msg_name,
-                        message_frame_id=fid,
-                        message_frame_id_hex=frame_id_hex(fid),
-                        name=sig_name,
-                        start=int(getattr(s, "start", 0)),
-                        length=int(getattr(s, "length", 0)),
-                        byte_order=byte_order,
-                        is_signed=is_signed,
-                        is_float=is_float,
-                        factor=getattr(s, "scale", None),
-                        offset=getattr(s, "offset", None),
-                        minimum=getattr(s, "minimum", None),
-                        maximum=getattr(s, "maximum", None),
-                        unit=getattr(s, "unit", None),
-                        receivers=receivers,
-                        comment=_get_comment(s),
-                        is_multiplexer=is_mux,
-                        multiplexer_ids=_multiplexer_ids(s),
-                        multiplexer_signal=mux_sig_name,
-                        choices=choices,
-                        attributes=sig_attrs,
-                    )
-                )
-
-                # signal attributes flattened
-                owner = f"{msg_name}.{sig_name}"
-                for k, v in sig_attrs.items():
-                    attributes.append(
-                        AttributeExport(scope="signal", owner=owner, key=str(k), value=v)
-                    )
-
-        # node attributes flattened
-        for n in nodes:
-            for k, v in n.attributes.items():
-                attributes.append(
-                    AttributeExport(scope="node", owner=n.name, key=str(k), value=v)
-                )
-
-        return DbcExport(nodes=nodes, messages=messages, signals=signals, attributes=attributes)
+        st = os.stat(dbc_path)
+        return _parse_file(dbc_path, st.st_mtime_ns, st.st_size, encoding, with_signals)
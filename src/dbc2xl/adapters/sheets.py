@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+# Column headers per sheet, shared by the XLSX and CSV writers. Order must
+# match the prebuilt .row tuples on the export models.
+
+MESSAGES_HEADERS = (
+    "Message Name",
+    "Frame ID (Hex)",
+    "Frame ID (Dec)",
+    "Extended Frame",
+    "DLC/Length",
+    "Cycle Time (ms)",
+    "Senders (Origin Nodes)",
+    "Comment",
+    "Attributes (Key=Value; ...)",
+)
+
+SIGNALS_HEADERS = (
+    "Message Name",
+    "Msg Frame ID (Hex)",
+    "Msg Frame ID (Dec)",
+    "Signal Name",
+    "Start Bit",
+    "Length (bits)",
+    "Byte Order",
+    "Signed",
+    "Float",
+    "Factor",
+    "Offset",
+    "Min",
+    "Max",
+    "Unit",
+    "Receivers",
+    "Multiplexer",
+    "Mux IDs",
+    "Mux Signal",
+    "Choices / Value Table",
+    "Comment",
+    "Attributes (Key=Value; ...)",
+)
+
+NODES_HEADERS = ("Node Name", "Comment", "Attributes (Key=Value; ...)")
+
+ATTRIBUTES_HEADERS = ("Scope", "Owner", "Key", "Value")
+
+VALUE_TABLES_HEADERS = ("Message", "Signal", "Frame ID (Hex)", "Value", "Text")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from .adapters.csv_writer import CsvWriter
 from .adapters.dbc_parser_cantools import CantoolsDbcParser
 from .adapters.excel_writer_openpyxl import OpenpyxlExcelWriter
 from .use_cases.convert import ConvertDbcToExcelUseCase
@@ -11,12 +12,20 @@ from .use_cases.convert import ConvertDbcToExcelUseCase
 class Application:
     use_case: ConvertDbcToExcelUseCase
 
-    def convert(self, dbc_path: str, xlsx_path: str, encoding: str | None) -> None:
-        self.use_case.execute(dbc_path=dbc_path, xlsx_path=xlsx_path, encoding=encoding)
+    def convert(
+        self,
+        dbc_path: str,
+        xlsx_path: str,
+        encoding: str | None,
+        sheets: set[str] | None = None,
+    ) -> None:
+        self.use_case.execute(
+            dbc_path=dbc_path, xlsx_path=xlsx_path, encoding=encoding, sheets=sheets
+        )
 
 
-def build_app() -> Application:
+def build_app(output_format: str = "xlsx") -> Application:
     parser = CantoolsDbcParser()
-    writer = OpenpyxlExcelWriter()
+    writer = CsvWriter() if output_format == "csv" else OpenpyxlExcelWriter()
     use_case = ConvertDbcToExcelUseCase(parser=parser, writer=writer)
     return Application(use_case=use_case)
@@ -5,6 +5,7 @@ import logging
 from pathlib import Path
 
 from .app import build_app
+from .use_cases.convert import SHEET_NAMES
 
 
 def _build_arg_parser() -> argparse.ArgumentParser:
@@ -14,11 +15,24 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     )
     p.add_argument("-i", "--input", required=True, help="Path to input .dbc file")
     p.add_argument("-o", "--output", required=True, help="Path to output .xlsx file")
+    p.add_argument(
+        "--format",
+        default="xlsx",
+        choices=["xlsx", "csv"],
+        help="Output format; csv writes one file per sheet next to the output path",
+    )
     p.add_argument(
         "--encoding",
         default=None,
         help="DBC file encoding (optional). Example: utf-8, latin-1",
     )
+    p.add_argument(
+        "--sheets",
+        nargs="+",
+        choices=SHEET_NAMES,
+        default=None,
+        help="Only emit the listed sheets (default: all)",
+    )
     p.add_argument(
         "--log-level",
         default="INFO",
@@ -39,13 +53,14 @@ def main() -> int:
     input_path = Path(args.input).expanduser().resolve()
     output_path = Path(args.output).expanduser().resolve()
 
-    app = build_app()
+    app = build_app(output_format=args.format)
 
     app.convert(
         dbc_path=str(input_path),
         xlsx_path=str(output_path),
         encoding=args.encoding,
+        sheets=set(args.sheets) if args.sheets else None,
     )
 
-    logging.getLogger(__name__).info("Wrote Excel export: %s", output_path)
+    logging.getLogger(__name__).info("Wrote %s export: %s", args.format, output_path)
     return 0
@@ -4,14 +4,16 @@ from dataclasses import dataclass
 from typing import Mapping, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeExport:
     name: str
-    comment: str | None
+    comment: str  # "" when the DBC has none
     attributes: Mapping[str, object]
+    attributes_str: str  # "Key=Value; ..." rendering, precomputed once at parse time
+    row: tuple[object, ...]  # exact Nodes-sheet row, prebuilt at parse time
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MessageExport:
     name: str
     frame_id: int
@@ -19,12 +21,14 @@ class MessageExport:
     is_extended_frame: bool | None
     length: int
     cycle_time_ms: int | None
-    senders: Sequence[str]
-    comment: str | None
+    senders: tuple[str, ...]
+    comment: str  # "" when the DBC has none
     attributes: Mapping[str, object]
+    attributes_str: str
+    row: tuple[object, ...]  # exact Messages-sheet row, prebuilt at parse time
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalExport:
     message_name: str
     message_frame_id: int
@@ -33,7 +37,7 @@ class SignalExport:
     name: str
     start: int
     length: int
-    byte_order: str | None
+    byte_order: str  # "" when unknown
     is_signed: bool | None
     is_float: bool | None
 
@@ -41,20 +45,23 @@ class SignalExport:
     offset: float | None
     minimum: float | None
     maximum: float | None
-    unit: str | None
+    unit: str  # "" when the signal is unitless
 
-    receivers: Sequence[str]
-    comment: str | None
+    receivers: tuple[str, ...]
+    comment: str  # "" when the DBC has none
 
     is_multiplexer: bool | None
-    multiplexer_ids: Sequence[int] | None
-    multiplexer_signal: str | None
+    multiplexer_ids: tuple[int, ...] | None
+    multiplexer_signal: str  # "" when not multiplexed
 
     choices: Mapping[int, str]  # value table/enum mapping
+    choices_items: tuple[tuple[int, str], ...]  # choices sorted by value, once
     attributes: Mapping[str, object]
+    attributes_str: str
+    row: tuple[object, ...]  # exact Signals-sheet row, prebuilt at parse time
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttributeExport:
     scope: str           # "node" | "message" | "signal"
     owner: str           # node name / message name / "Message.Signal"
@@ -62,7 +69,7 @@ class AttributeExport:
     value: object
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DbcExport:
     nodes: Sequence[NodeExport]
     messages: Sequence[MessageExport]
@@ -1,31 +1,44 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from typing import Protocol
 
 from ..domain.models import DbcExport
 
 logger = logging.getLogger(__name__)
 
+SHEET_NAMES = ("Messages", "Signals", "Nodes", "Attributes", "ValueTables")
 
-class DbcParser:
-    def parse(self, dbc_path: str, encoding: str | None) -> DbcExport:
-        raise NotImplementedError
 
+class DbcParser(Protocol):
+    # structural port: adapters satisfy it without inheriting
+    def parse(
+        self, dbc_path: str, encoding: str | None, sheets: set[str] | None = None
+    ) -> DbcExport: ...
 
-class ExcelWriter:
-    def write(self, export: DbcExport, xlsx_path: str) -> None:
-        raise NotImplementedError
 
+class ExcelWriter(Protocol):
+    def write(
+        self, export: DbcExport, xlsx_path: str, sheets: set[str] | None = None
+    ) -> None: ...
 
-@dataclass(frozen=True)
-class ConvertDbcToExcelUseCase:
-    parser: DbcParser
-    writer: ExcelWriter
 
-    def execute(self, dbc_path: str, xlsx_path: str, encoding: str | None) -> None:
+class ConvertDbcToExcelUseCase:
+    def __init__(self, parser: DbcParser, writer: ExcelWriter) -> None:
+        self.parser = parser
+        self.writer = writer
+
+    def execute(
+        self,
+        dbc_path: str,
+        xlsx_path: str,
+        encoding: str | None,
+        sheets: set[str] | None = None,
+    ) -> None:
+        # sheets=None means all of SHEET_NAMES; a subset lets the parser
+        # skip signal flattening when no signal-backed sheet is wanted
         logger.info("Parsing DBC: %s", dbc_path)
-        export = self.parser.parse(dbc_path=dbc_path, encoding=encoding)
+        export = self.parser.parse(dbc_path=dbc_path, encoding=encoding, sheets=sheets)
 
         logger.info(
             "Parsed: %d nodes, %d messages, %d signals, %d attributes",
@@ -35,5 +48,5 @@ class ConvertDbcToExcelUseCase:
             len(export.attributes),
         )
 
-        logger.info("Writing XLSX: %s", xlsx_path)
-        self.writer.write(export=export, xlsx_path=xlsx_path)
+        logger.info("Writing export: %s", xlsx_path)
+        self.writer.write(export=export, xlsx_path=xlsx_path, sheets=sheets)
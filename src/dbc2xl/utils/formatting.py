@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Mapping
+from typing import Iterable, Tuple
 
 
 def frame_id_hex(frame_id: int) -> str:
@@ -8,13 +8,24 @@ def frame_id_hex(frame_id: int) -> str:
     return f"0x{frame_id:X}"
 
 
-def stringify_choices(choices: Mapping[int, str]) -> str:
-    # Stable, readable: "0=Off; 1=On; 2=Fault"
-    items = sorted(choices.items(), key=lambda kv: kv[0])
+def stringify_choices(items: Iterable[Tuple[int, str]]) -> str:
+    # Stable, readable: "0=Off; 1=On; 2=Fault"; items must be pre-sorted
     return "; ".join([f"{k}={v}" for k, v in items])
 
 
 def safe_str(v: object) -> str:
+    # exact-type dispatch for the common cell types; str passes through
+    # untouched and floats use "g" formatting, which is cheaper than
+    # str()'s shortest-roundtrip repr
     if v is None:
         return ""
+    t = type(v)
+    if t is str:
+        return v
+    if t is bool:
+        return "Yes" if v else "No"
+    if t is int:
+        return str(v)
+    if t is float:
+        return format(v, "g")
     return str(v)